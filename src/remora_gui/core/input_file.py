@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -107,7 +108,7 @@ def parse_input_file(path: str | Path) -> OrderedDict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _format_value(value: Any) -> str:
+def format_value(value: Any) -> str:
     """Format a single Python value back to AMReX ParmParse syntax."""
     if isinstance(value, bool):
         return "true" if value else "false"
@@ -121,7 +122,7 @@ def _format_value(value: Any) -> str:
     if isinstance(value, int):
         return str(value)
     if isinstance(value, list):
-        return " ".join(_format_value(v) for v in value)
+        return " ".join(format_value(v) for v in value)
     # String — no quoting needed in the output (REMORA reads unquoted fine)
     return str(value)
 
@@ -158,7 +159,7 @@ def clean_params_for_remora(params: dict[str, Any]) -> dict[str, Any]:
 
 
 def write_input_string(
-    params: dict[str, Any],
+    params: Mapping[str, Any],
     *,
     schema: dict[str, list[Any]] | None = None,
     include_defaults: bool = False,
@@ -208,7 +209,7 @@ def write_input_string(
                 and value == default_lookup[key]
             ):
                 continue
-            section_lines.append(f"{key} = {_format_value(value)}")
+            section_lines.append(f"{key} = {format_value(value)}")
 
         if not section_lines:
             continue
@@ -224,7 +225,7 @@ def write_input_string(
 
 
 def write_input_file(
-    params: dict[str, Any],
+    params: Mapping[str, Any],
     path: str | Path,
     *,
     schema: dict[str, list[Any]] | None = None,
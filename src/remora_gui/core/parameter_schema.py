@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -565,13 +566,20 @@ PARAMETER_SCHEMA: dict[str, list[REMORAParameter]] = {
 }
 
 
+# Flat key → parameter index (in group order), built once at import.
+SCHEMA_BY_KEY: dict[str, REMORAParameter] = {
+    param.key: param for params in PARAMETER_SCHEMA.values() for param in params
+}
+
+ALL_SCHEMA_KEYS: frozenset[str] = frozenset(SCHEMA_BY_KEY)
+
+
 def get_parameter(key: str) -> REMORAParameter:
     """Look up a parameter by its key. Raises KeyError if not found."""
-    for params in PARAMETER_SCHEMA.values():
-        for param in params:
-            if param.key == key:
-                return param
-    raise KeyError(f"Unknown parameter: {key!r}")
+    try:
+        return SCHEMA_BY_KEY[key]
+    except KeyError:
+        raise KeyError(f"Unknown parameter: {key!r}") from None
 
 
 def get_group(name: str) -> list[REMORAParameter]:
@@ -581,10 +589,15 @@ def get_group(name: str) -> list[REMORAParameter]:
     return PARAMETER_SCHEMA[name]
 
 
+@functools.lru_cache(maxsize=1)
+def _defaults_template() -> dict[str, Any]:
+    return {key: param.default for key, param in SCHEMA_BY_KEY.items()}
+
+
 def get_defaults() -> dict[str, Any]:
-    """Return a dict mapping every parameter key to its default value."""
-    return {
-        param.key: param.default
-        for params in PARAMETER_SCHEMA.values()
-        for param in params
-    }
+    """Return a dict mapping every parameter key to its default value.
+
+    The schema walk is cached; each call returns a fresh shallow copy that
+    callers may modify.
+    """
+    return dict(_defaults_template())
@@ -11,19 +11,31 @@ import threading
 import time
 from collections.abc import Callable
 from pathlib import PurePosixPath, PureWindowsPath
-from typing import Any
-
-import paramiko
+from typing import TYPE_CHECKING, Any
 
 from remora_gui.core.execution import parse_step
 from remora_gui.core.settings import MachineProfile
 
+if TYPE_CHECKING:
+    import paramiko
+
 logger = logging.getLogger(__name__)
 
 _CONNECT_TIMEOUT = 30
 _RECV_BUFSIZE = 4096
 
 
+def _paramiko() -> Any:
+    """Import paramiko on first use.
+
+    paramiko pulls in cryptography/bcrypt at import time, so it is only
+    loaded once a connection is actually made.
+    """
+    import paramiko
+
+    return paramiko
+
+
 class RemoteExecutionEngine:
     """Run REMORA on a remote machine over SSH with live log streaming."""
 
@@ -101,6 +113,7 @@ class RemoteExecutionEngine:
 
     def connect(self, *, password: str | None = None) -> None:
         """Establish SSH connection to the remote machine."""
+        paramiko = _paramiko()
         try:
             client = paramiko.SSHClient()
             client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 import platform
+from collections import OrderedDict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 
 def _default_config_dir() -> Path:
     """Return the platform-appropriate config directory for REMORA-GUI."""
@@ -111,6 +120,18 @@ class MachineProfile:
 _SETTINGS_FILE = "settings.json"
 
 
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Encode settings as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict[str, Any]:
+    data: dict[str, Any] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data
+
+
 class AppSettings:
     """Persistent application settings backed by a JSON file.
 
@@ -125,7 +146,15 @@ class AppSettings:
         self._dir = Path(config_dir) if config_dir is not None else _default_config_dir()
         self._dir.mkdir(parents=True, exist_ok=True)
         self._path = self._dir / _SETTINGS_FILE
+        # Bytes currently on disk, so unchanged settings are never rewritten.
+        self._written: bytes | None = None
         self._data: dict[str, Any] = self._load()
+        # Most recent first; keys give O(1) dedup and reordering.
+        self._recents: OrderedDict[str, None] = OrderedDict.fromkeys(
+            self._data.get("recent_projects", [])
+        )
+        self._dirty = False
+        self._batch_depth = 0
 
     # ------------------------------------------------------------------
     # Internal persistence
@@ -133,11 +162,43 @@ class AppSettings:
 
     def _load(self) -> dict[str, Any]:
         if self._path.exists():
-            return json.loads(self._path.read_text())  # type: ignore[no-any-return]
+            self._written = self._path.read_bytes()
+            return _loads(self._written)
         return {}
 
     def _save(self) -> None:
-        self._path.write_text(json.dumps(self._data, indent=2))
+        """Mark settings dirty and write them unless inside :meth:`batch`."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any."""
+        if self._dirty:
+            raw = _dumps(self._data)
+            if raw != self._written:
+                # Write to a sibling temp file and rename over the original so a
+                # crash mid-write never leaves a truncated settings.json.
+                tmp = self._path.with_name(self._path.name + ".tmp")
+                tmp.write_bytes(raw)
+                os.replace(tmp, self._path)
+                self._written = raw
+            self._dirty = False
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes until the outermost ``with settings.batch():`` block exits.
+
+        Collapses a run of mutations (e.g. several ``add_recent_project``
+        calls) into a single rewrite of ``settings.json``.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
 
     # ------------------------------------------------------------------
     # Machine profiles
@@ -190,14 +251,14 @@ class AppSettings:
 
     def get_recent_projects(self) -> list[str]:
         """Return recently opened project paths (most recent first)."""
-        return list(self._data.get("recent_projects", []))
+        return list(self._recents)
 
     def add_recent_project(self, path: str | Path) -> None:
         """Push *path* to the front of the recent-projects list."""
-        recents: list[str] = self._data.setdefault("recent_projects", [])
         s = str(path)
-        if s in recents:
-            recents.remove(s)
-        recents.insert(0, s)
-        self._data["recent_projects"] = recents[: self._MAX_RECENT]
+        self._recents[s] = None
+        self._recents.move_to_end(s, last=False)
+        while len(self._recents) > self._MAX_RECENT:
+            self._recents.popitem(last=True)
+        self._data["recent_projects"] = list(self._recents)
         self._save()
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import itertools
-from collections import OrderedDict
+import math
+import os
+import string
+from collections import ChainMap
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from remora_gui.core.input_file import write_input_file
+from remora_gui.core.input_file import format_value, write_input_string
+
+_MAX_WRITE_WORKERS = 8
 
 
 @dataclass
@@ -26,14 +33,13 @@ class SweepAxis:
         if self.explicit is not None:
             return list(self.explicit)
         if self.start is not None and self.end is not None and self.step is not None:
-            vals: list[float] = []
-            v = self.start
-            while v <= self.end + self.step * 1e-9:  # tolerance for float rounding
-                if v > self.end + self.step * 0.5:
-                    break
-                vals.append(v)
-                v += self.step
-            return vals
+            if self.step <= 0:
+                raise ValueError(f"SweepAxis '{self.key}' step must be positive.")
+            # Whole steps that fit in [start, end], with a tolerance for float
+            # rounding.  Each point is computed from start rather than by
+            # accumulation, so there is no drift, and int ranges stay int.
+            n = math.floor((self.end - self.start) / self.step + 1e-9) + 1
+            return [self.start + i * self.step for i in range(n)]
         raise ValueError(
             f"SweepAxis '{self.key}' must specify either range (start/end/step) "
             f"or explicit values."
@@ -51,21 +57,144 @@ class SweepConfig:
     header_comment: str = "Generated by REMORA-GUI parameter sweep"
 
 
+def _iter_combinations(axes: list[SweepAxis]) -> Iterator[dict[str, Any]]:
+    """Yield one parameter-override dict per point of the sweep's Cartesian product."""
+    if not axes:
+        yield {}
+        return
+
+    keys = [a.key for a in axes]
+    value_lists = [a.values() for a in axes]
+
+    for combo in itertools.product(*value_lists):
+        yield dict(zip(keys, combo, strict=True))
+
+
 def generate_sweep_combinations(axes: list[SweepAxis]) -> list[dict[str, Any]]:
     """Compute the Cartesian product of all sweep axes.
 
     Returns a list of dicts, each mapping parameter key → value for one run.
     """
-    if not axes:
-        return [{}]
+    return list(_iter_combinations(axes))
 
-    keys = [a.key for a in axes]
-    value_lists = [a.values() for a in axes]
 
-    return [
-        dict(zip(keys, combo, strict=True))
-        for combo in itertools.product(*value_lists)
-    ]
+def _placeholder(key: str) -> str:
+    # NUL never appears in a rendered input file, so this cannot collide.
+    return f"\x00{key}\x00"
+
+
+def _render_template(config: SweepConfig) -> str:
+    """Render the input file once, with a placeholder for each swept value."""
+    placeholders = {axis.key: _placeholder(axis.key) for axis in config.axes}
+    return write_input_string(
+        ChainMap(placeholders, config.base_params), header_comment=config.header_comment
+    )
+
+
+def _render_run(config: SweepConfig, template: str, overrides: dict[str, Any]) -> str:
+    """Render one combination by patching its values into *template*."""
+    if any(v == "" or v == [] or v is None for v in overrides.values()):
+        # The writer drops empty values entirely; render those runs in full.
+        # Overrides shadow the base without copying it; keys keep base order.
+        merged = ChainMap(overrides, config.base_params)
+        return write_input_string(merged, header_comment=config.header_comment)
+    content = template
+    for key, val in overrides.items():
+        content = content.replace(_placeholder(key), format_value(val))
+    return content
+
+
+_CONVERSIONS: dict[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
+
+
+def _compile_name_template(template: str) -> Callable[[dict[str, Any]], str]:
+    """Parse *template* once and return a function that renders it for one run.
+
+    ``{key}`` fields naming a swept parameter are replaced by its value (a
+    conversion such as ``!r`` and a format spec such as ``{remora.fixed_dt:g}``
+    are honoured, as in :meth:`str.format`); any other field is kept verbatim.
+    """
+    try:
+        pieces = list(string.Formatter().parse(template))
+    except ValueError as exc:
+        raise ValueError(f"Invalid sweep name template {template!r}: {exc}") from None
+    for _, _, _, conversion in pieces:
+        if conversion and conversion not in _CONVERSIONS:
+            raise ValueError(
+                f"Invalid sweep name template {template!r}: unknown conversion "
+                f"'!{conversion}'"
+            )
+
+    def render(overrides: dict[str, Any]) -> str:
+        parts: list[str] = []
+        for literal, field_name, spec, conversion in pieces:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if field_name in overrides:
+                val = overrides[field_name]
+                if conversion:
+                    val = _CONVERSIONS[conversion](val)
+                parts.append(format(val, spec) if spec else str(val))
+            else:
+                conv = f"!{conversion}" if conversion else ""
+                fmt = f":{spec}" if spec else ""
+                parts.append(f"{{{field_name}{conv}{fmt}}}")
+        return "".join(parts)
+
+    return render
+
+
+def _iter_run_names(config: SweepConfig) -> Iterator[str]:
+    """Yield the run name of each combination, rejecting duplicates as they appear.
+
+    Two runs with the same name would write to the same ``inputs`` file.  The
+    default ``sweep_NNN`` names are unique by construction, so only templated
+    names are tracked.
+    """
+    if not config.name_template:
+        for i, _ in enumerate(_iter_combinations(config.axes)):
+            yield f"sweep_{i:03d}"
+        return
+    render_name = _compile_name_template(config.name_template)
+    seen: set[str] = set()
+    for overrides in _iter_combinations(config.axes):
+        name = render_name(overrides)
+        if name in seen:
+            raise ValueError(
+                f"Sweep name template {config.name_template!r} gives more than one "
+                f"run the name {name!r}; include every swept parameter in it."
+            )
+        seen.add(name)
+        yield name
+
+
+def _iter_runs(config: SweepConfig) -> Iterator[tuple[str, str, Path]]:
+    """Yield ``(run_name, input_file_text, input_file_path)`` for each combination."""
+    template = _render_template(config)
+    runs = zip(_iter_run_names(config), _iter_combinations(config.axes), strict=True)
+    for name, overrides in runs:
+        content = _render_run(config, template, overrides)
+        yield name, content, config.output_dir / name / "inputs"
+
+
+def _write_run(content: str, input_path: Path) -> None:
+    input_path.parent.mkdir(parents=True, exist_ok=True)
+    input_path.write_text(content)
+
+
+def generate_sweep_inputs_iter(
+    config: SweepConfig,
+) -> Iterator[tuple[str, Path]]:
+    """Generate input files for the sweep one combination at a time.
+
+    Yields ``(run_name, input_file_path)`` after each file is written, so
+    large sweeps never hold every combination in memory at once.  A templated
+    run name that repeats an earlier one raises ``ValueError`` when reached.
+    """
+    for name, content, input_path in _iter_runs(config):
+        _write_run(content, input_path)
+        yield name, input_path
 
 
 def generate_sweep_inputs(
@@ -73,29 +202,23 @@ def generate_sweep_inputs(
 ) -> list[tuple[str, Path]]:
     """Generate input files for every combination in the sweep.
 
-    Returns a list of ``(run_name, input_file_path)`` tuples.
+    Returns a list of ``(run_name, input_file_path)`` tuples in combination
+    order.  The writes are I/O-bound, so they are overlapped on a small
+    thread pool, one bounded batch at a time.  Raises ``ValueError`` before
+    writing anything if two runs would get the same name.
     """
-    combos = generate_sweep_combinations(config.axes)
+    if config.name_template:
+        # Reject duplicate names before the first write, not partway through.
+        for _ in _iter_run_names(config):
+            pass
+    workers = min(_MAX_WRITE_WORKERS, os.cpu_count() or 1)
+    runs = _iter_runs(config)
     results: list[tuple[str, Path]] = []
-
-    for i, overrides in enumerate(combos):
-        # Build merged params
-        merged = OrderedDict(config.base_params)
-        merged.update(overrides)
-
-        # Generate run name
-        if config.name_template:
-            name = config.name_template
-            for key, val in overrides.items():
-                name = name.replace(f"{{{key}}}", str(val))
-        else:
-            name = f"sweep_{i:03d}"
-
-        # Write input file
-        run_dir = config.output_dir / name
-        run_dir.mkdir(parents=True, exist_ok=True)
-        input_path = run_dir / "inputs"
-        write_input_file(merged, input_path, header_comment=config.header_comment)
-        results.append((name, input_path))
-
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # Render one batch per pool pass so only a few files are held in
+        # memory at a time.
+        while batch := list(itertools.islice(runs, workers)):
+            # Drain the iterator so any write error propagates here.
+            list(ex.map(lambda run: _write_run(run[1], run[2]), batch))
+            results.extend((name, input_path) for name, _, input_path in batch)
     return results
@@ -2,25 +2,78 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import os
+import sys
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 _TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
 
 
+def _intern_strings(obj: Any) -> Any:
+    """Return *obj* with every str key and leaf passed through ``sys.intern``.
+
+    The bundled templates repeat the same parameter keys and categories, so
+    the cached copies share one string object per distinct value.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(v) for v in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _template_index() -> tuple[dict[str, Any], ...]:
+    """Scan the bundled templates once; the directory is fixed at install time."""
+    # scandir's DirEntry carries the file type, avoiding a stat per entry.
+    with os.scandir(_TEMPLATES_DIR) as it:
+        entries = [
+            e for e in it if e.is_file(follow_symlinks=False) and e.name.endswith(".json")
+        ]
+    entries.sort(key=lambda e: e.name)
+
+    templates: list[dict[str, Any]] = []
+    for entry in entries:
+        data = json.loads(Path(entry.path).read_text())
+        templates.append(
+            _intern_strings({
+                "name": data["name"],
+                "description": data["description"],
+                "category": data.get("category", ""),
+                "file": entry.name,
+            })
+        )
+    return tuple(templates)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_template(stem: str) -> dict[str, Any]:
+    path = _TEMPLATES_DIR / f"{stem}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"Template not found: {stem!r}")
+    return _intern_strings(json.loads(path.read_text()))  # type: ignore[no-any-return]
+
+
 def list_templates() -> list[dict[str, Any]]:
     """Return metadata for all bundled templates (sorted by name)."""
-    templates: list[dict[str, Any]] = []
-    for path in sorted(_TEMPLATES_DIR.glob("*.json")):
-        data = json.loads(path.read_text())
-        templates.append({
-            "name": data["name"],
-            "description": data["description"],
-            "category": data.get("category", ""),
-            "file": path.name,
-        })
-    return templates
+    return [dict(t) for t in _template_index()]
+
+
+def _cached_template(name: str) -> dict[str, Any]:
+    # Accept with or without .json extension; normalise before the cache key
+    # so "upwelling" and "upwelling.json" share one entry.
+    stem = name.removesuffix(".json")
+    try:
+        return _read_template(stem)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {name!r}") from None
 
 
 def load_template(name: str) -> dict[str, Any]:
@@ -29,9 +82,14 @@ def load_template(name: str) -> dict[str, Any]:
     Returns the full template dict including ``name``, ``description``,
     ``category``, and ``parameters``.
     """
-    # Accept with or without .json extension
-    stem = name.removesuffix(".json")
-    path = _TEMPLATES_DIR / f"{stem}.json"
-    if not path.exists():
-        raise FileNotFoundError(f"Template not found: {name!r}")
-    return json.loads(path.read_text())  # type: ignore[no-any-return]
+    # Parsed templates are cached; hand out a copy callers may mutate.
+    return copy.deepcopy(_cached_template(name))
+
+
+def load_template_readonly(name: str) -> Mapping[str, Any]:
+    """Like :func:`load_template`, but return the shared cached instance.
+
+    Avoids the deep copy for callers that only inspect the template.  The
+    result must not be mutated.
+    """
+    return _cached_template(name)
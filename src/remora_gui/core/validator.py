@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -20,11 +22,17 @@ class ValidationMessage:
 # Individual rule implementations
 # ---------------------------------------------------------------------------
 
-_FACE_PAIRS: list[tuple[int, str, str]] = [
-    (0, "remora.bc.xlo.type", "remora.bc.xhi.type"),
-    (1, "remora.bc.ylo.type", "remora.bc.yhi.type"),
-    (2, "remora.bc.zlo.type", "remora.bc.zhi.type"),
-]
+# Bit order for R002's face masks: (lo, hi) per axis.
+_FACE_KEYS = (
+    "remora.bc.xlo.type",
+    "remora.bc.xhi.type",
+    "remora.bc.ylo.type",
+    "remora.bc.yhi.type",
+    "remora.bc.zlo.type",
+    "remora.bc.zhi.type",
+)
+
+_AXIS_LABELS = ("x", "y", "z")
 
 _CORIOLIS_SUB_KEYS = [
     "remora.coriolis_type",
@@ -33,14 +41,16 @@ _CORIOLIS_SUB_KEYS = [
 ]
 
 
-def _r001_fast_dt_divides_dt(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r001_fast_dt_divides_dt(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """fixed_fast_dt should evenly divide fixed_dt."""
     dt = params.get("remora.fixed_dt")
     fast_dt = params.get("remora.fixed_fast_dt")
     if dt is None or fast_dt is None or fast_dt == 0:
         return []
-    remainder = dt % fast_dt
-    if abs(remainder) > 1e-12 and abs(remainder - fast_dt) > 1e-12:
+    # Compare the step ratio to the nearest integer; relative tolerance
+    # absorbs float rounding (e.g. 0.3 / 0.1) without a float modulo.
+    ratio = dt / fast_dt
+    if not math.isclose(ratio, round(ratio), rel_tol=1e-9, abs_tol=1e-12):
         return [
             ValidationMessage(
                 level="warning",
@@ -55,37 +65,48 @@ def _r001_fast_dt_divides_dt(params: dict[str, Any]) -> list[ValidationMessage]:
     return []
 
 
-def _r002_periodic_bc_match(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r002_periodic_bc_match(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """Periodic faces must have matching is_periodic flags."""
     is_periodic = params.get("remora.is_periodic")
     if not isinstance(is_periodic, list) or len(is_periodic) < 3:
         return []
 
+    # Bit 2*axis is the axis's lo face and bit 2*axis+1 its hi face.
+    periodic_faces = 0
+    for axis in range(3):
+        if is_periodic[axis] == 1:
+            periodic_faces |= 0b11 << (2 * axis)
+    if not periodic_faces:
+        return []
+
+    set_faces = 0
+    for bit, face_key in enumerate(_FACE_KEYS):
+        face_type = params.get(face_key)
+        if face_type is not None and face_type != "Periodic":
+            set_faces |= 1 << bit
+
+    # Periodic axis — face BCs should be absent or "Periodic"
+    bad = set_faces & periodic_faces
     msgs: list[ValidationMessage] = []
-    for axis, lo_key, hi_key in _FACE_PAIRS:
-        periodic = is_periodic[axis]
-        lo_type = params.get(lo_key)
-        hi_type = params.get(hi_key)
-
-        if periodic == 1:
-            # Periodic axis — face BCs should be absent or "Periodic"
-            for face_key, face_type in [(lo_key, lo_type), (hi_key, hi_type)]:
-                if face_type is not None and face_type != "Periodic":
-                    msgs.append(
-                        ValidationMessage(
-                            level="error",
-                            message=(
-                                f"Axis {axis} is periodic but {face_key} is "
-                                f"set to {face_type!r} (expected Periodic or unset)."
-                            ),
-                            parameter_keys=["remora.is_periodic", face_key],
-                            rule_id="R002",
-                        )
-                    )
+    while bad:
+        bit = (bad & -bad).bit_length() - 1
+        bad &= bad - 1
+        face_key = _FACE_KEYS[bit]
+        msgs.append(
+            ValidationMessage(
+                level="error",
+                message=(
+                    f"Axis {bit // 2} is periodic but {face_key} is "
+                    f"set to {params[face_key]!r} (expected Periodic or unset)."
+                ),
+                parameter_keys=["remora.is_periodic", face_key],
+                rule_id="R002",
+            )
+        )
     return msgs
 
 
-def _r003_n_cell_positive(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r003_n_cell_positive(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """n_cell values must all be > 0."""
     n_cell = params.get("remora.n_cell")
     if not isinstance(n_cell, list):
@@ -103,17 +124,17 @@ def _r003_n_cell_positive(params: dict[str, Any]) -> list[ValidationMessage]:
     return []
 
 
-def _r004_prob_hi_gt_lo(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r004_prob_hi_gt_lo(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """prob_hi[i] must be > prob_lo[i] for each dimension."""
     lo = params.get("remora.prob_lo")
     hi = params.get("remora.prob_hi")
     if not isinstance(lo, list) or not isinstance(hi, list):
         return []
-    labels = ["x", "y", "z"]
     msgs: list[ValidationMessage] = []
     for i in range(min(len(lo), len(hi))):
-        if hi[i] <= lo[i]:
-            label = labels[i] if i < len(labels) else str(i)
+        # Written as "not greater" rather than "<=" so NaN bounds are flagged.
+        if not (hi[i] > lo[i]):
+            label = _AXIS_LABELS[i] if i < len(_AXIS_LABELS) else str(i)
             msgs.append(
                 ValidationMessage(
                     level="error",
@@ -128,7 +149,7 @@ def _r004_prob_hi_gt_lo(params: dict[str, Any]) -> list[ValidationMessage]:
     return msgs
 
 
-def _r005_coriolis_unused(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r005_coriolis_unused(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """If use_coriolis is false, Coriolis sub-params should not be set."""
     if params.get("remora.use_coriolis") is not False:
         return []
@@ -149,7 +170,7 @@ def _r005_coriolis_unused(params: dict[str, Any]) -> list[ValidationMessage]:
     return []
 
 
-def _r006_grid_size_ge_blocking(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r006_grid_size_ge_blocking(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """max_grid_size should be >= blocking_factor."""
     grid = params.get("amr.max_grid_size")
     block = params.get("amr.blocking_factor")
@@ -170,7 +191,7 @@ def _r006_grid_size_ge_blocking(params: dict[str, Any]) -> list[ValidationMessag
     return []
 
 
-def _r007_cfl_estimate(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r007_cfl_estimate(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """CFL condition estimate: dt * max_velocity / dx < 1.
 
     Uses a conservative velocity estimate of 2 m/s (typical ocean current).
@@ -216,7 +237,7 @@ def _r007_cfl_estimate(params: dict[str, Any]) -> list[ValidationMessage]:
 
 
 def _r008_procs_divide_domain(
-    params: dict[str, Any], num_procs: int
+    params: Mapping[str, Any], num_procs: int
 ) -> list[ValidationMessage]:
     """num_procs should evenly divide the total number of grid cells."""
     if num_procs <= 1:
@@ -244,7 +265,7 @@ def _r008_procs_divide_domain(
     return []
 
 
-def _r009_n_cell_divisible_by_blocking(params: dict[str, Any]) -> list[ValidationMessage]:
+def _r009_n_cell_divisible_by_blocking(params: Mapping[str, Any]) -> list[ValidationMessage]:
     """n_cell values should be divisible by blocking_factor."""
     n_cell = params.get("remora.n_cell")
     block = params.get("amr.blocking_factor")
@@ -252,10 +273,9 @@ def _r009_n_cell_divisible_by_blocking(params: dict[str, Any]) -> list[Validatio
         return []
 
     bad: list[str] = []
-    labels = ["x", "y", "z"]
     for i, n in enumerate(n_cell):
         if n % block != 0:
-            label = labels[i] if i < len(labels) else str(i)
+            label = _AXIS_LABELS[i] if i < len(_AXIS_LABELS) else str(i)
             bad.append(f"n_cell[{label}]={n}")
 
     if bad:
@@ -288,7 +308,7 @@ _RULES = [
 ]
 
 
-def validate(params: dict[str, Any], *, num_procs: int = 1) -> list[ValidationMessage]:
+def validate(params: Mapping[str, Any], *, num_procs: int = 1) -> list[ValidationMessage]:
     """Run all validation rules against *params* and return findings."""
     messages: list[ValidationMessage] = []
     for rule in _RULES:
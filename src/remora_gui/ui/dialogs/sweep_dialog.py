@@ -17,7 +17,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from remora_gui.core.parameter_schema import PARAMETER_SCHEMA
+from remora_gui.core.parameter_schema import ALL_SCHEMA_KEYS
 from remora_gui.core.sweep import SweepAxis
 
 
@@ -33,10 +33,7 @@ class _AxisWidget(QGroupBox):
         self.setLayout(form)
 
         self._param_combo = QComboBox()
-        all_keys: list[str] = []
-        for params in PARAMETER_SCHEMA.values():
-            all_keys.extend(p.key for p in params)
-        self._param_combo.addItems(sorted(all_keys))
+        self._param_combo.addItems(sorted(ALL_SCHEMA_KEYS))
         form.addRow("Parameter:", self._param_combo)
 
         self._start_spin = QDoubleSpinBox()
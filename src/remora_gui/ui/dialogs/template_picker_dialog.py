@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from remora_gui.core.templates import list_templates, load_template
+from remora_gui.core.templates import list_templates, load_template_readonly
 
 
 class TemplatePickerDialog(QDialog):
@@ -60,7 +60,7 @@ class TemplatePickerDialog(QDialog):
             return
         filename = current.data(256)
         try:
-            t = load_template(filename)
+            t = load_template_readonly(filename)
             params = t.get("parameters", {})
             lines = [f"{k} = {v}" for k, v in list(params.items())[:10]]
             if len(params) > 10:
@@ -0,0 +1,16 @@
+"""Reusable parameter-input widgets."""
+
+from remora_gui.ui.widgets.collapsible_group import CollapsibleGroupBox
+from remora_gui.ui.widgets.enum_combo import EnumComboBox
+from remora_gui.ui.widgets.file_picker import FilePickerWidget
+from remora_gui.ui.widgets.parameter_widget import ParameterWidget, ScientificSpinBox
+from remora_gui.ui.widgets.vector3_widget import Vector3Widget
+
+__all__ = [
+    "CollapsibleGroupBox",
+    "EnumComboBox",
+    "FilePickerWidget",
+    "ParameterWidget",
+    "ScientificSpinBox",
+    "Vector3Widget",
+]
@@ -0,0 +1,83 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from remora_gui.core.validator import validate
+from tests.remote_helpers import MockSSHStack
+from tests.validation_helpers import MessagesByRule
+
+
+@pytest.fixture
+def mocked_ssh_stack() -> Iterator[MockSSHStack]:
+    """Patch paramiko with a client -> transport -> channel/sftp mock graph.
+
+    The lazy ``_paramiko`` accessor is patched, so the real paramiko is
+    never imported.
+    """
+    paramiko = MagicMock()
+    paramiko.SSHException = type("SSHException", (Exception,), {})
+    with patch("remora_gui.core.remote._paramiko", return_value=paramiko):
+        ssh_cls = paramiko.SSHClient
+        client = MagicMock()
+        ssh_cls.return_value = client
+        transport = MagicMock()
+        client.get_transport.return_value = transport
+        channel = MagicMock()
+        transport.open_session.return_value = channel
+        sftp = MagicMock()
+        client.open_sftp.return_value = sftp
+        yield MockSSHStack(ssh_cls, client, transport, channel, sftp)
+
+
+# ---------------------------------------------------------------------------
+# Qt
+# ---------------------------------------------------------------------------
+
+
+class LiteQtBot:
+    """Stand-in for pytest-qt's ``qtbot`` with only ``addWidget``.
+
+    Registered widgets are closed together when the module finishes, with no
+    per-test event processing.
+    """
+
+    def __init__(self) -> None:
+        self._widgets: list[Any] = []
+
+    def addWidget(self, widget: Any) -> None:
+        self._widgets.append(widget)
+
+    def close_all(self) -> None:
+        for widget in self._widgets:
+            widget.close()
+            widget.deleteLater()
+        self._widgets.clear()
+
+
+@pytest.fixture(scope="module")
+def qtbot_lite(qapp: Any) -> Iterator[LiteQtBot]:
+    """Module-scoped ``qtbot`` substitute for tests that never wait on signals."""
+    bot = LiteQtBot()
+    yield bot
+    bot.close_all()
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def validate_indexed() -> Callable[..., MessagesByRule]:
+    """``validate()``, with the messages indexed by rule id."""
+
+    def _indexed(params: Mapping[str, Any], num_procs: int = 1) -> MessagesByRule:
+        return MessagesByRule(validate(params, num_procs=num_procs))
+
+    return _indexed
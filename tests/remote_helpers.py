@@ -0,0 +1,47 @@
+"""Shared helpers for the core/remote.py test modules."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple
+from unittest.mock import MagicMock
+
+from remora_gui.core.settings import MachineProfile
+
+DEFAULT_PROFILE_KWARGS: Mapping[str, object] = MappingProxyType(
+    {
+        "id": "test-machine",
+        "name": "Test Machine",
+        "host_type": "remote",
+        "hostname": "gpu-box.local",
+        "port": 22,
+        "username": "researcher",
+        "auth_method": "key",
+        "ssh_key_path": "/home/user/.ssh/id_rsa",
+        "os_type": "linux",
+        "remora_executable_path": "/opt/remora/bin/remora",
+        "mpi_command": "mpirun",
+        "default_num_procs": 4,
+        "working_directory": "/scratch/runs",
+    }
+)
+
+
+def make_profile(**overrides: object) -> MachineProfile:
+    """Return a test profile with *overrides* applied to the defaults.
+
+    pre_run_commands is left to the dataclass default_factory unless
+    overridden.
+    """
+    return MachineProfile(**{**DEFAULT_PROFILE_KWARGS, **overrides})  # type: ignore[arg-type]
+
+
+class MockSSHStack(NamedTuple):
+    """Pre-wired paramiko mocks yielded by the ``mocked_ssh_stack`` fixture."""
+
+    ssh_cls: MagicMock
+    client: MagicMock
+    transport: MagicMock
+    channel: MagicMock
+    sftp: MagicMock
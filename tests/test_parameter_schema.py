@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 
 from remora_gui.core.parameter_schema import (
+    ALL_SCHEMA_KEYS,
     PARAMETER_GROUPS,
     PARAMETER_SCHEMA,
+    SCHEMA_BY_KEY,
     REMORAParameter,
     get_defaults,
     get_group,
@@ -28,6 +32,16 @@ ALL_PARAMS: list[REMORAParameter] = [
 # REMORAParameter dataclass
 # ---------------------------------------------------------------------------
 
+# Optional REMORAParameter fields that default to None.
+OPTIONAL_NONE_FIELDS = {
+    "min_value",
+    "max_value",
+    "enum_options",
+    "depends_on",
+    "units",
+    "reference_url",
+}
+
 SAMPLE_PARAM = REMORAParameter(
     key="remora.fixed_dt",
     label="Time Step (dt)",
@@ -65,12 +79,10 @@ class TestREMORAParameter:
             dtype="int",
             default=0,
         )
-        assert minimal.min_value is None
-        assert minimal.max_value is None
-        assert minimal.enum_options is None
-        assert minimal.depends_on is None
-        assert minimal.units is None
-        assert minimal.reference_url is None
+        none_defaults = {f.name for f in fields(REMORAParameter) if f.default is None}
+        assert none_defaults == OPTIONAL_NONE_FIELDS
+        for name in none_defaults:
+            assert getattr(minimal, name) is None, f"{name} should default to None"
         assert minimal.required is False
 
     def test_frozen(self) -> None:
@@ -171,6 +183,22 @@ class TestHelpers:
         defaults = get_defaults()
         assert len(defaults) == len(ALL_PARAMS)
 
+    def test_get_defaults_returns_independent_copies(self) -> None:
+        first = get_defaults()
+        first["remora.fixed_dt"] = -1.0
+        first["custom.extra"] = 1
+        second = get_defaults()
+        assert second["remora.fixed_dt"] != -1.0
+        assert "custom.extra" not in second
+
+    def test_all_schema_keys(self) -> None:
+        assert {p.key for p in ALL_PARAMS} == ALL_SCHEMA_KEYS
+
+    def test_schema_by_key_matches_groups(self) -> None:
+        assert list(SCHEMA_BY_KEY.values()) == ALL_PARAMS
+        for param in ALL_PARAMS:
+            assert get_parameter(param.key) is param
+
 
 # ---------------------------------------------------------------------------
 # Schema population validation (Task 1.2)
@@ -236,13 +264,9 @@ class TestSchemaPopulation:
 
     def test_depends_on_keys_exist_in_schema(self) -> None:
         """Every key referenced in depends_on must exist in the schema."""
-        all_keys = {p.key for p in ALL_PARAMS}
-        for param in ALL_PARAMS:
-            if param.depends_on is not None:
-                for dep_key in param.depends_on:
-                    assert dep_key in all_keys, (
-                        f"{param.key}: depends_on references unknown key {dep_key!r}"
-                    )
+        dep_keys = {k for p in ALL_PARAMS if p.depends_on for k in p.depends_on}
+        missing = dep_keys - {p.key for p in ALL_PARAMS}
+        assert not missing, f"depends_on references unknown keys: {sorted(missing)}"
 
     def test_expected_group_sizes(self) -> None:
         """Spot-check expected parameter counts per group."""
@@ -0,0 +1,95 @@
+"""Tests for core/remote.py SSH connection handling — Task 3.1."""
+
+from __future__ import annotations
+
+import pytest
+
+from remora_gui.core.remote import RemoteExecutionEngine
+from tests.remote_helpers import MockSSHStack, make_profile
+
+# ---------------------------------------------------------------------------
+# SSH connection
+# ---------------------------------------------------------------------------
+
+
+class TestConnect:
+    def test_connect_with_key(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_client = mocked_ssh_stack.client
+
+        profile = make_profile(auth_method="key", ssh_key_path="/home/user/.ssh/id_rsa")
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+
+        mock_client.set_missing_host_key_policy.assert_called_once()
+        mock_client.connect.assert_called_once_with(
+            hostname="gpu-box.local",
+            port=22,
+            username="researcher",
+            key_filename="/home/user/.ssh/id_rsa",
+            timeout=30,
+        )
+
+    def test_connect_with_password(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_client = mocked_ssh_stack.client
+
+        profile = make_profile(auth_method="password")
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect(password="secret123")
+
+        mock_client.connect.assert_called_once_with(
+            hostname="gpu-box.local",
+            port=22,
+            username="researcher",
+            password="secret123",
+            timeout=30,
+        )
+
+    def test_connect_with_agent(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_client = mocked_ssh_stack.client
+
+        profile = make_profile(auth_method="agent")
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+
+        mock_client.connect.assert_called_once_with(
+            hostname="gpu-box.local",
+            port=22,
+            username="researcher",
+            allow_agent=True,
+            timeout=30,
+        )
+
+    def test_connect_failure_raises(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mocked_ssh_stack.client.connect.side_effect = OSError("Connection refused")
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        with pytest.raises(ConnectionError, match="Connection refused"):
+            engine.connect()
+
+    def test_disconnect(self, mocked_ssh_stack: MockSSHStack) -> None:
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+        engine.disconnect()
+        mocked_ssh_stack.client.close.assert_called_once()
@@ -0,0 +1,96 @@
+"""Tests for core/remote.py remote execution lifecycle — Task 3.1."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from remora_gui.core.remote import RemoteExecutionEngine
+from tests.remote_helpers import MockSSHStack, make_profile
+
+# ---------------------------------------------------------------------------
+# Remote execution
+# ---------------------------------------------------------------------------
+
+_START_CMD_RE = re.compile(r"mpirun -np 4 /opt/remora/bin/remora inputs$")
+_KILL_CMD_RE = re.compile(r"\bkill\b.*\b12345\b")
+
+# Simulated remote stdout, one bytes object per recv() call.
+_STDOUT_CHUNKS = (b"Step 1\n",)
+
+
+class TestRemoteExecution:
+    # The reader thread polls with time.sleep(); skip the real waits so the
+    # mocked channel drains immediately.
+    @patch("remora_gui.core.remote.time.sleep", lambda *_: None)
+    def test_start_executes_command(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_channel = mocked_ssh_stack.channel
+        # Main loop: one recv, then exit. Bound iterator __next__ methods are
+        # plain callables, so mock invokes them directly without its
+        # list-to-iterator side_effect handling.
+        mock_channel.recv_ready.side_effect = iter((True, False, False, False)).__next__
+        mock_channel.recv.side_effect = iter(_STDOUT_CHUNKS)
+        mock_channel.recv_stderr_ready.side_effect = iter((False, False, False)).__next__
+        mock_channel.exit_status_ready.side_effect = iter((False, True)).__next__
+        mock_channel.recv_exit_status.return_value = 0
+
+        on_stdout = MagicMock()
+        on_finished = MagicMock()
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=4,
+            on_stdout=on_stdout,
+            on_finished=on_finished,
+        )
+        engine.connect()
+        engine.start()
+
+        # Wait for reader thread to finish
+        for t in engine._threads:
+            t.join(timeout=5)
+
+        mock_channel.exec_command.assert_called_once()
+        cmd_arg = mock_channel.exec_command.call_args[0][0]
+        assert _START_CMD_RE.search(cmd_arg)
+        on_stdout.assert_called_once_with("Step 1")
+
+    # stop() waits between SIGTERM and SIGKILL; skip the real wait.
+    @patch("remora_gui.core.remote.time.sleep", lambda *_: None)
+    def test_stop_sends_kill(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_client = mocked_ssh_stack.client
+        mock_channel = mocked_ssh_stack.channel
+        mock_channel.exit_status_ready.return_value = False
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+        # Simulate a running channel
+        engine._channel = mock_channel
+        engine._remote_pid = 12345
+
+        engine.stop()
+
+        # Should execute kill command over SSH
+        mock_client.exec_command.assert_called()
+        kill_cmd = mock_client.exec_command.call_args[0][0]
+        assert _KILL_CMD_RE.search(kill_cmd)
+
+    @pytest.mark.usefixtures("mocked_ssh_stack")
+    def test_start_requires_connection(self) -> None:
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        with pytest.raises(ConnectionError, match="Not connected"):
+            engine.start()
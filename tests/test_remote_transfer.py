@@ -0,0 +1,92 @@
+"""Tests for core/remote.py SFTP file transfer — Task 3.1."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from remora_gui.core.remote import RemoteExecutionEngine
+from tests.remote_helpers import MockSSHStack, make_profile
+
+# ---------------------------------------------------------------------------
+# File transfer
+# ---------------------------------------------------------------------------
+
+
+class TestFileTransfer:
+    def test_upload_input(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_sftp = mocked_ssh_stack.sftp
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+        engine.upload_input("/local/path/inputs")
+
+        mock_sftp.put.assert_called_once_with(
+            "/local/path/inputs",
+            "/scratch/runs/inputs",
+        )
+        mock_sftp.close.assert_called_once()
+
+    def test_upload_custom_remote_path(self, mocked_ssh_stack: MockSSHStack) -> None:
+        mock_sftp = mocked_ssh_stack.sftp
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+        engine.upload_input("/local/path/inputs", remote_path="/custom/dir/my_inputs")
+
+        mock_sftp.put.assert_called_once_with(
+            "/local/path/inputs",
+            "/custom/dir/my_inputs",
+        )
+
+    @patch("remora_gui.core.remote.os.makedirs")
+    def test_download_output(
+        self, mock_makedirs: MagicMock, mocked_ssh_stack: MockSSHStack
+    ) -> None:
+        mock_sftp = mocked_ssh_stack.sftp
+        # Simulate a remote directory with two regular files
+        mock_sftp.listdir_attr.return_value = [
+            SimpleNamespace(filename=f"output_{i:04d}.nc", st_mode=0o100644) for i in (1, 2)
+        ]
+
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        engine.connect()
+
+        progress_cb = MagicMock()
+        engine.download_output(
+            remote_dir="/scratch/runs/output",
+            local_dir="/local/output",
+            progress_callback=progress_cb,
+        )
+
+        mock_makedirs.assert_called_once_with("/local/output", exist_ok=True)
+        assert mock_sftp.get.call_count == 2
+        assert progress_cb.call_count == 2
+
+    @pytest.mark.usefixtures("mocked_ssh_stack")
+    def test_upload_requires_connection(self) -> None:
+        profile = make_profile()
+        engine = RemoteExecutionEngine(
+            profile=profile,
+            input_file="inputs",
+            num_procs=1,
+        )
+        with pytest.raises(ConnectionError, match="Not connected"):
+            engine.upload_input("/local/path/inputs")
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pytest
+
 from remora_gui.core.settings import AppSettings, MachineProfile
 
 # ---------------------------------------------------------------------------
@@ -87,14 +90,22 @@ def _make_profile(name: str = "Test", host_type: str = "local") -> MachineProfil
     )
 
 
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    return tmp_path / "config"
+
+
+@pytest.fixture
+def settings(config_dir: Path) -> AppSettings:
+    return AppSettings(config_dir)
+
+
 class TestAppSettings:
-    def test_empty_on_fresh_dir(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_empty_on_fresh_dir(self, settings: AppSettings) -> None:
         assert settings.get_machine_profiles() == []
         assert settings.get_recent_projects() == []
 
-    def test_save_and_get_machine_profile(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_save_and_get_machine_profile(self, settings: AppSettings) -> None:
         p = _make_profile("Box A")
         settings.save_machine_profile(p)
 
@@ -102,8 +113,7 @@ class TestAppSettings:
         assert len(profiles) == 1
         assert profiles[0].name == "Box A"
 
-    def test_update_existing_profile(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_update_existing_profile(self, settings: AppSettings) -> None:
         p = _make_profile("Original")
         settings.save_machine_profile(p)
 
@@ -114,33 +124,34 @@ class TestAppSettings:
         assert len(profiles) == 1
         assert profiles[0].name == "Updated"
 
-    def test_delete_machine_profile(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_delete_machine_profile(self, settings: AppSettings) -> None:
         p = _make_profile("ToDelete")
         settings.save_machine_profile(p)
         settings.delete_machine_profile(p.id)
 
         assert settings.get_machine_profiles() == []
 
-    def test_persistence_across_instances(self, tmp_path: Path) -> None:
-        config_dir = tmp_path / "config"
-        s1 = AppSettings(config_dir)
-        s1.save_machine_profile(_make_profile("Persistent"))
+    def test_persistence_across_instances(self, settings: AppSettings, config_dir: Path) -> None:
+        settings.save_machine_profile(_make_profile("Persistent"))
 
         s2 = AppSettings(config_dir)
         assert len(s2.get_machine_profiles()) == 1
         assert s2.get_machine_profiles()[0].name == "Persistent"
 
-    def test_default_project_dir(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_save_replaces_file_atomically(self, settings: AppSettings, config_dir: Path) -> None:
+        settings.save_machine_profile(_make_profile("Atomic"))
+        settings.add_recent_project("/proj/a")
+
+        assert sorted(p.name for p in config_dir.iterdir()) == ["settings.json"]
+
+    def test_default_project_dir(self, settings: AppSettings) -> None:
         # Default fallback
         assert settings.get_default_project_dir() == Path.home() / "remora_projects"
 
         settings.set_default_project_dir("/custom/path")
         assert settings.get_default_project_dir() == Path("/custom/path")
 
-    def test_recent_projects(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_recent_projects(self, settings: AppSettings) -> None:
         settings.add_recent_project("/proj/a")
         settings.add_recent_project("/proj/b")
         settings.add_recent_project("/proj/c")
@@ -148,8 +159,7 @@ class TestAppSettings:
         recents = settings.get_recent_projects()
         assert recents == ["/proj/c", "/proj/b", "/proj/a"]
 
-    def test_recent_projects_deduplicates(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_recent_projects_deduplicates(self, settings: AppSettings) -> None:
         settings.add_recent_project("/proj/a")
         settings.add_recent_project("/proj/b")
         settings.add_recent_project("/proj/a")  # move to front
@@ -157,9 +167,35 @@ class TestAppSettings:
         recents = settings.get_recent_projects()
         assert recents == ["/proj/a", "/proj/b"]
 
-    def test_recent_projects_max_limit(self, tmp_path: Path) -> None:
-        settings = AppSettings(tmp_path / "config")
+    def test_recent_projects_max_limit(self, settings: AppSettings) -> None:
         for i in range(15):
             settings.add_recent_project(f"/proj/{i}")
 
-        assert len(settings.get_recent_projects()) == 10
+        recents = settings.get_recent_projects()
+        assert len(recents) == 10
+        assert recents[0] == "/proj/14"
+        assert recents[-1] == "/proj/5"
+
+    def test_batch_defers_writes(self, settings: AppSettings, config_dir: Path) -> None:
+        with settings.batch():
+            for i in range(15):
+                settings.add_recent_project(f"/proj/{i}")
+            settings.set_default_project_dir("/custom/path")
+            # Nothing written until the batch exits.
+            assert AppSettings(config_dir).get_recent_projects() == []
+
+        reloaded = AppSettings(config_dir)
+        assert reloaded.get_recent_projects()[0] == "/proj/14"
+        assert reloaded.get_default_project_dir() == Path("/custom/path")
+
+    def test_unchanged_settings_are_not_rewritten(
+        self, settings: AppSettings, config_dir: Path
+    ) -> None:
+        settings.add_recent_project("/proj/a")
+        path = config_dir / "settings.json"
+        # Backdate the file so any rewrite would show up as a new mtime.
+        os.utime(path, ns=(0, 0))
+
+        settings.add_recent_project("/proj/a")  # already first
+        AppSettings(config_dir).add_recent_project("/proj/a")
+        assert path.stat().st_mtime_ns == 0
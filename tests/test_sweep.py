@@ -12,6 +12,7 @@ from remora_gui.core.sweep import (
     SweepConfig,
     generate_sweep_combinations,
     generate_sweep_inputs,
+    generate_sweep_inputs_iter,
 )
 
 
@@ -48,6 +49,27 @@ class TestSweepAxis:
         axis = SweepAxis(key="x", start=5.0, end=5.0, step=1.0)
         assert axis.values() == [5.0]
 
+    def test_range_does_not_accumulate_drift(self) -> None:
+        axis = SweepAxis(key="x", start=0.0, end=1.0, step=0.1)
+        vals = axis.values()
+        assert len(vals) == 11
+        assert vals[-1] == 1.0
+
+    def test_int_range_stays_int(self) -> None:
+        axis = SweepAxis(key="remora.max_step", start=100, end=300, step=100)
+        vals = axis.values()
+        assert vals == [100, 200, 300]
+        assert all(type(v) is int for v in vals)
+
+    def test_empty_when_end_before_start(self) -> None:
+        axis = SweepAxis(key="x", start=5.0, end=1.0, step=1.0)
+        assert axis.values() == []
+
+    def test_non_positive_step_raises(self) -> None:
+        axis = SweepAxis(key="x", start=0.0, end=1.0, step=0.0)
+        with pytest.raises(ValueError, match="step must be positive"):
+            axis.values()
+
 
 class TestGenerateSweepCombinations:
     """Test combinatorial generation from multiple axes."""
@@ -80,6 +102,18 @@ class TestGenerateSweepCombinations:
         combos = generate_sweep_combinations(axes)
         assert len(combos) == 8  # 2 * 2 * 2
 
+    def test_last_axis_varies_fastest(self) -> None:
+        axes = [
+            SweepAxis(key="dt", explicit=[100, 200]),
+            SweepAxis(key="visc", explicit=[1e-3, 1e-4]),
+        ]
+        assert generate_sweep_combinations(axes) == [
+            {"dt": 100, "visc": 1e-3},
+            {"dt": 100, "visc": 1e-4},
+            {"dt": 200, "visc": 1e-3},
+            {"dt": 200, "visc": 1e-4},
+        ]
+
     def test_empty_axes_returns_single_empty(self) -> None:
         combos = generate_sweep_combinations([])
         assert combos == [{}]
@@ -123,6 +157,61 @@ class TestGenerateSweepInputs:
         assert "run_dt100_v0.01" in names
         assert "run_dt200_v0.01" in names
 
+    def test_name_template_format_spec_and_unknown_fields(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="remora.fixed_dt", explicit=[0.5])]
+        config = SweepConfig(
+            base_params=OrderedDict(),
+            axes=axes,
+            name_template="run_{remora.fixed_dt:.3f}_{other}",
+            output_dir=tmp_path,
+        )
+        assert generate_sweep_inputs(config)[0][0] == "run_0.500_{other}"
+
+    def test_name_template_conversion(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="mix", explicit=["gls"])]
+        config = SweepConfig(
+            base_params=OrderedDict(),
+            axes=axes,
+            name_template="run_{mix!r}_{other!r}",
+            output_dir=tmp_path,
+        )
+        assert generate_sweep_inputs(config)[0][0] == "run_'gls'_{other!r}"
+
+    def test_unknown_conversion_raises(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="dt", explicit=[1])]
+        config = SweepConfig(
+            base_params=OrderedDict(), axes=axes, name_template="run_{dt!z}", output_dir=tmp_path
+        )
+        with pytest.raises(ValueError, match="unknown conversion"):
+            generate_sweep_inputs(config)
+
+    def test_malformed_name_template_raises(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="dt", explicit=[1])]
+        config = SweepConfig(
+            base_params=OrderedDict(), axes=axes, name_template="run_{dt", output_dir=tmp_path
+        )
+        with pytest.raises(ValueError, match="name template"):
+            generate_sweep_inputs(config)
+
+    def test_duplicate_run_names_raise_before_writing(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="dt", explicit=[1, 2]), SweepAxis(key="visc", explicit=[3, 4])]
+        config = SweepConfig(
+            base_params=OrderedDict(), axes=axes, name_template="run_{dt}", output_dir=tmp_path
+        )
+        with pytest.raises(ValueError, match="'run_1'"):
+            generate_sweep_inputs(config)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_iter_rejects_duplicate_run_name_when_reached(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="dt", explicit=[1, 2]), SweepAxis(key="visc", explicit=[3, 4])]
+        config = SweepConfig(
+            base_params=OrderedDict(), axes=axes, name_template="run_{dt}", output_dir=tmp_path
+        )
+        it = generate_sweep_inputs_iter(config)
+        assert next(it)[0] == "run_1"
+        with pytest.raises(ValueError, match="'run_1'"):
+            next(it)
+
     def test_default_name_template(self, tmp_path: Path) -> None:
         base_params = OrderedDict([("x", 0)])
         axes = [SweepAxis(key="x", explicit=[1, 2])]
@@ -147,3 +236,53 @@ class TestGenerateSweepInputs:
         content = results[0][1].read_text()
         assert "100.0" in content
         assert "300.0" not in content
+
+    def test_results_follow_combination_order(self, tmp_path: Path) -> None:
+        axes = [SweepAxis(key="remora.fixed_dt", explicit=[float(v) for v in range(20)])]
+        config = SweepConfig(
+            base_params=OrderedDict(), axes=axes, output_dir=tmp_path
+        )
+        results = generate_sweep_inputs(config)
+        assert [name for name, _ in results] == [f"sweep_{i:03d}" for i in range(20)]
+        for i, (_, path) in enumerate(results):
+            assert f"remora.fixed_dt = {float(i)}" in path.read_text()
+
+    def test_vector_and_empty_overrides(self, tmp_path: Path) -> None:
+        base_params = OrderedDict([("remora.n_cell", [41, 80, 16]), ("remora.plot_file", "plt")])
+        axes = [
+            SweepAxis(key="remora.n_cell", explicit=[[10, 20, 30]]),
+            SweepAxis(key="remora.plot_file", explicit=["", "out"]),
+        ]
+        config = SweepConfig(
+            base_params=base_params, axes=axes, output_dir=tmp_path
+        )
+        (_, empty_path), (_, set_path) = generate_sweep_inputs(config)
+        empty_content = empty_path.read_text()
+        assert "remora.n_cell = 10 20 30" in empty_content
+        assert "remora.plot_file" not in empty_content
+        assert "remora.plot_file = out" in set_path.read_text()
+
+    def test_output_keeps_base_key_order(self, tmp_path: Path) -> None:
+        base_params = OrderedDict([("remora.fixed_dt", 300.0), ("remora.max_step", 10)])
+        axes = [
+            SweepAxis(key="remora.stop_time", explicit=[5.0]),
+            SweepAxis(key="remora.fixed_dt", explicit=[100.0]),
+        ]
+        config = SweepConfig(
+            base_params=base_params, axes=axes, output_dir=tmp_path
+        )
+        lines = generate_sweep_inputs(config)[0][1].read_text().splitlines()
+        keys = [line.split(" = ")[0] for line in lines if " = " in line]
+        assert keys == ["remora.fixed_dt", "remora.max_step", "remora.stop_time"]
+        assert base_params == OrderedDict([("remora.fixed_dt", 300.0), ("remora.max_step", 10)])
+
+    def test_iter_writes_lazily(self, tmp_path: Path) -> None:
+        base_params = OrderedDict([("x", 0)])
+        axes = [SweepAxis(key="x", explicit=[1, 2, 3])]
+        config = SweepConfig(base_params=base_params, axes=axes, output_dir=tmp_path)
+        it = generate_sweep_inputs_iter(config)
+        name, path = next(it)
+        assert name == "sweep_000"
+        assert path.exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["sweep_000"]
+        assert [n for n, _ in it] == ["sweep_001", "sweep_002"]
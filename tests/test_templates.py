@@ -4,13 +4,8 @@ from __future__ import annotations
 
 import pytest
 
-from remora_gui.core.parameter_schema import PARAMETER_SCHEMA
-from remora_gui.core.templates import list_templates, load_template
-
-# All known schema keys for validation.
-ALL_SCHEMA_KEYS = {
-    p.key for group in PARAMETER_SCHEMA.values() for p in group
-}
+from remora_gui.core.parameter_schema import ALL_SCHEMA_KEYS
+from remora_gui.core.templates import list_templates, load_template, load_template_readonly
 
 REQUIRED_META_KEYS = {"name", "description", "category", "parameters"}
 
@@ -26,6 +21,10 @@ class TestListTemplates:
             assert "description" in t
             assert "file" in t
 
+    def test_mutating_result_does_not_leak(self) -> None:
+        list_templates()[0]["name"] = "changed"
+        assert list_templates()[0]["name"] != "changed"
+
     def test_sorted_by_name(self) -> None:
         names = [t["name"] for t in list_templates()]
         assert names == sorted(names)
@@ -40,19 +39,28 @@ class TestLoadTemplate:
         t = load_template("upwelling.json")
         assert t["name"] == "Upwelling"
 
+    def test_mutating_result_does_not_leak(self) -> None:
+        t = load_template("upwelling")
+        t["parameters"].clear()
+        assert load_template("upwelling")["parameters"]
+
+    def test_readonly_returns_cached_instance(self) -> None:
+        assert load_template_readonly("upwelling") is load_template_readonly("upwelling.json")
+        assert load_template("upwelling") == load_template_readonly("upwelling")
+
     def test_not_found_raises(self) -> None:
         with pytest.raises(FileNotFoundError):
             load_template("nonexistent")
 
     def test_all_templates_have_required_keys(self) -> None:
         for meta in list_templates():
-            t = load_template(meta["file"])
+            t = load_template_readonly(meta["file"])
             missing = REQUIRED_META_KEYS - set(t.keys())
             assert not missing, f"{meta['file']} missing keys: {missing}"
 
     def test_all_templates_parse_without_error(self) -> None:
         for meta in list_templates():
-            t = load_template(meta["file"])
+            t = load_template_readonly(meta["file"])
             assert isinstance(t["parameters"], dict)
             assert len(t["parameters"]) > 0 or meta["file"] == "blank.json"
 
@@ -63,7 +71,7 @@ class TestTemplateParameterKeys:
 
     def test_known_keys(self) -> None:
         for meta in list_templates():
-            t = load_template(meta["file"])
+            t = load_template_readonly(meta["file"])
             for key in t["parameters"]:
                 assert key in ALL_SCHEMA_KEYS, (
                     f"Template {meta['file']}: unknown parameter key {key!r}"
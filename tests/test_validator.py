@@ -2,14 +2,52 @@
 
 from __future__ import annotations
 
-from remora_gui.core.parameter_schema import get_defaults
-from remora_gui.core.validator import validate
+from collections import ChainMap, Counter
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
 
+import pytest
 
-def _defaults(**overrides: object) -> dict[str, object]:
-    """Return schema defaults with optional overrides."""
-    d = get_defaults()
-    d.update(overrides)
+from remora_gui.core.parameter_schema import get_defaults
+from remora_gui.core.validator import validate
+from tests.validation_helpers import MessagesByRule
+
+# Signature of the session-scoped validation fixture in conftest.py.
+ValidateIndexed = Callable[..., MessagesByRule]
+
+# One read-only snapshot of the schema defaults, with list values frozen as
+# tuples so no test can mutate the shared copy in place.
+_DEFAULTS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    k: tuple(v) if isinstance(v, list) else v for k, v in get_defaults().items()
+})
+_LIST_KEYS = tuple(k for k, v in _DEFAULTS_TEMPLATE.items() if isinstance(v, tuple))
+
+# Override value that removes the key from the defaults instead.
+_UNSET = object()
+
+# Default schema has is_periodic=[1,0,0] (x-axis periodic), so the x-face BC
+# types must be removed to avoid an R002 conflict.
+_NO_X_BC = {"remora.bc.xlo.type": _UNSET, "remora.bc.xhi.type": _UNSET}
+
+_VALID_BOUNDS = {
+    "remora.prob_lo": [0.0, 0.0, -150.0],
+    "remora.prob_hi": [41000.0, 80000.0, 0.0],
+    "remora.n_cell": [41, 80, 16],
+}
+
+
+def _defaults(**overrides: object) -> dict[str, Any]:
+    """Return schema defaults with optional overrides (``_UNSET`` removes a key)."""
+    d = dict(_DEFAULTS_TEMPLATE)
+    # The rules only accept lists, so un-freeze the vector defaults.
+    for k in _LIST_KEYS:
+        d[k] = list(d[k])
+    for k, v in overrides.items():
+        if v is _UNSET:
+            d.pop(k, None)
+        else:
+            d[k] = v
     return d
 
 
@@ -20,249 +58,192 @@ def _defaults(**overrides: object) -> dict[str, object]:
 
 class TestValidDefaults:
     def test_defaults_produce_no_errors(self) -> None:
-        # Default schema has is_periodic=[1,0,0] (x-axis periodic),
-        # so remove x-face BC types to avoid R002 conflict.
-        params = _defaults()
-        params.pop("remora.bc.xlo.type", None)
-        params.pop("remora.bc.xhi.type", None)
-        msgs = validate(params)
+        msgs = validate(_defaults(**_NO_X_BC))
         errors = [m for m in msgs if m.level == "error"]
         assert errors == [], [m.message for m in errors]
 
-
-# ---------------------------------------------------------------------------
-# R001 — fixed_fast_dt should evenly divide fixed_dt
-# ---------------------------------------------------------------------------
-
-
-class TestR001:
-    def test_clean_division_no_warning(self) -> None:
-        msgs = validate(_defaults(**{"remora.fixed_dt": 300.0, "remora.fixed_fast_dt": 10.0}))
-        assert all(m.rule_id != "R001" for m in msgs)
-
-    def test_uneven_division_warns(self) -> None:
-        msgs = validate(_defaults(**{"remora.fixed_dt": 300.0, "remora.fixed_fast_dt": 7.0}))
-        r001 = [m for m in msgs if m.rule_id == "R001"]
-        assert len(r001) == 1
-        assert r001[0].level == "warning"
-
-
-# ---------------------------------------------------------------------------
-# R002 — Periodic faces must match is_periodic flags
-# ---------------------------------------------------------------------------
-
-
-class TestR002:
-    def test_periodic_without_bc_no_error(self) -> None:
-        """is_periodic=[1,0,0] with no xlo/xhi BC set → fine."""
-        params = _defaults()
-        # Remove x-face BCs so they don't conflict
-        params.pop("remora.bc.xlo.type", None)
-        params.pop("remora.bc.xhi.type", None)
-        msgs = validate(params)
-        assert all(m.rule_id != "R002" for m in msgs)
-
-    def test_periodic_with_non_periodic_bc_errors(self) -> None:
-        params = _defaults(**{
-            "remora.is_periodic": [1, 0, 0],
-            "remora.bc.xlo.type": "SlipWall",
-        })
-        r002 = [m for m in validate(params) if m.rule_id == "R002"]
-        assert len(r002) >= 1
-        assert r002[0].level == "error"
-
-    def test_non_periodic_axis_any_bc_ok(self) -> None:
-        params = _defaults(**{
+    def test_validate_accepts_any_mapping(self) -> None:
+        base = _defaults()
+        params = ChainMap({"remora.n_cell": [0, 80, 16]}, base)
+        assert validate(params) == validate({**base, "remora.n_cell": [0, 80, 16]})
+
+    def test_defaults_only_trip_cfl_estimate(self, validate_indexed: ValidateIndexed) -> None:
+        buckets = validate_indexed(_defaults(**_NO_X_BC))
+        assert buckets.rule_ids == {"R007"}
+        assert buckets.counts() == Counter(R007=1)
+
+    def test_raw_defaults_conflict_on_periodic_x_faces(
+        self, validate_indexed: ValidateIndexed
+    ) -> None:
+        assert validate_indexed(_defaults()).counts() == Counter(R002=2, R007=1)
+
+
+# ---------------------------------------------------------------------------
+# Per-rule cases: one validate() pass per params dict, filtered by rule id
+# ---------------------------------------------------------------------------
+
+_RULE_CASES = [
+    # R001 — fixed_fast_dt should evenly divide fixed_dt
+    pytest.param(
+        {"remora.fixed_dt": 300.0, "remora.fixed_fast_dt": 10.0}, 1, "R001", 0, None,
+        id="R001-clean_division",
+    ),
+    pytest.param(
+        {"remora.fixed_dt": 0.3, "remora.fixed_fast_dt": 0.1}, 1, "R001", 0, None,
+        id="R001-fractional_division",
+    ),
+    pytest.param(
+        {"remora.fixed_dt": 300.0, "remora.fixed_fast_dt": 7.0}, 1, "R001", 1, "warning",
+        id="R001-uneven_division",
+    ),
+    # R002 — periodic faces must match is_periodic flags
+    pytest.param(_NO_X_BC, 1, "R002", 0, None, id="R002-periodic_without_bc"),
+    pytest.param(
+        {"remora.is_periodic": [1, 0, 0], "remora.bc.xlo.type": "SlipWall"},
+        1, "R002", 2, "error",
+        id="R002-periodic_with_non_periodic_bc",
+    ),
+    pytest.param(
+        {
             "remora.is_periodic": [0, 0, 0],
             "remora.bc.xlo.type": "SlipWall",
             "remora.bc.xhi.type": "Outflow",
+        },
+        1, "R002", 0, None,
+        id="R002-non_periodic_axis_any_bc",
+    ),
+    # R003 — n_cell values must all be > 0
+    pytest.param({"remora.n_cell": [41, 80, 16]}, 1, "R003", 0, None, id="R003-positive"),
+    pytest.param({"remora.n_cell": [0, 80, 16]}, 1, "R003", 1, "error", id="R003-zero"),
+    pytest.param(
+        {"remora.n_cell": [41, -1, 16]}, 1, "R003", 1, "error",
+        id="R003-negative", marks=pytest.mark.extended,
+    ),
+    # R004 — prob_hi[i] must be > prob_lo[i]
+    pytest.param(_VALID_BOUNDS, 1, "R004", 0, None, id="R004-valid_bounds"),
+    pytest.param(
+        {"remora.prob_lo": [0.0, 0.0, 0.0], "remora.prob_hi": [0.0, 0.0, 0.0]},
+        1, "R004", 3, "error",
+        id="R004-equal_bounds_one_per_dimension",
+    ),
+    # R005 — Coriolis sub-params when use_coriolis=false
+    pytest.param({"remora.use_coriolis": True}, 1, "R005", 0, None, id="R005-enabled"),
+    # Defaults include the Coriolis sub-params from the schema.
+    pytest.param(
+        {"remora.use_coriolis": False}, 1, "R005", 1, "info",
+        id="R005-disabled_with_sub_params",
+    ),
+    # R006 — max_grid_size >= blocking_factor
+    pytest.param(
+        {"amr.max_grid_size": 2048, "amr.blocking_factor": 1}, 1, "R006", 0, None,
+        id="R006-grid_ge_blocking",
+    ),
+    pytest.param(
+        {"amr.max_grid_size": 4, "amr.blocking_factor": 16}, 1, "R006", 1, "warning",
+        id="R006-grid_lt_blocking",
+    ),
+    # R007 — CFL condition estimate
+    # dx_min = 150/16 = 9.375m, dt = 1s → CFL = 1 * 2 / 9.375 = 0.21 < 1
+    pytest.param(
+        {**_VALID_BOUNDS, "remora.fixed_dt": 1.0}, 1, "R007", 0, None, id="R007-cfl_ok",
+    ),
+    # dx = 41000/41 = 1000m, dt = 1000s → CFL = 1000 * 2 / 1000 = 2.0 > 1
+    pytest.param(
+        {**_VALID_BOUNDS, "remora.fixed_dt": 1000.0}, 1, "R007", 1, "warning",
+        id="R007-cfl_violated",
+    ),
+    pytest.param({"remora.fixed_dt": _UNSET}, 1, "R007", 0, None, id="R007-dt_missing"),
+    # R008 — num_procs should evenly divide the domain
+    pytest.param({"remora.n_cell": [80, 80, 16]}, 4, "R008", 0, None, id="R008-divisible"),
+    # n_cell = [7, 7, 7], num_procs = 4 → total cells 343 not divisible by 4
+    pytest.param(
+        {"remora.n_cell": [7, 7, 7]}, 4, "R008", 1, "warning", id="R008-not_divisible",
+    ),
+    pytest.param({"remora.n_cell": [7, 7, 7]}, 1, "R008", 0, None, id="R008-single_proc"),
+    # R009 — n_cell should be divisible by blocking_factor
+    pytest.param(
+        {"remora.n_cell": [80, 80, 16], "amr.blocking_factor": 8}, 1, "R009", 0, None,
+        id="R009-divisible",
+    ),
+    pytest.param(
+        {"remora.n_cell": [41, 80, 16], "amr.blocking_factor": 8}, 1, "R009", 1, "warning",
+        id="R009-not_divisible",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("overrides", "num_procs", "rule_id", "expected_count", "expected_level"), _RULE_CASES
+)
+def test_rule(
+    validate_indexed: ValidateIndexed,
+    overrides: dict[str, object],
+    num_procs: int,
+    rule_id: str,
+    expected_count: int,
+    expected_level: str | None,
+) -> None:
+    hits = validate_indexed(_defaults(**overrides), num_procs=num_procs)[rule_id]
+    assert len(hits) == expected_count, [m.message for m in hits]
+    assert all(m.level == expected_level for m in hits)
+
+
+# ---------------------------------------------------------------------------
+# Message details
+# ---------------------------------------------------------------------------
+
+
+class TestMessageDetails:
+    def test_r002_reports_offending_faces_in_order(
+        self, validate_indexed: ValidateIndexed
+    ) -> None:
+        params = _defaults(**{
+            "remora.is_periodic": [1, 0, 1],
+            "remora.bc.xlo.type": "SlipWall",
+            "remora.bc.xhi.type": "Periodic",
+            "remora.bc.ylo.type": "SlipWall",
+            "remora.bc.zlo.type": "Outflow",
+            "remora.bc.zhi.type": "SlipWall",
         })
-        msgs = validate(params)
-        assert all(m.rule_id != "R002" for m in msgs)
-
-
-# ---------------------------------------------------------------------------
-# R003 — n_cell values must all be > 0
-# ---------------------------------------------------------------------------
-
-
-class TestR003:
-    def test_positive_cells_ok(self) -> None:
-        msgs = validate(_defaults(**{"remora.n_cell": [41, 80, 16]}))
-        assert all(m.rule_id != "R003" for m in msgs)
-
-    def test_zero_cell_errors(self) -> None:
-        msgs = validate(_defaults(**{"remora.n_cell": [0, 80, 16]}))
-        r003 = [m for m in msgs if m.rule_id == "R003"]
-        assert len(r003) == 1
-        assert r003[0].level == "error"
-
-    def test_negative_cell_errors(self) -> None:
-        msgs = validate(_defaults(**{"remora.n_cell": [41, -1, 16]}))
-        r003 = [m for m in msgs if m.rule_id == "R003"]
-        assert len(r003) == 1
-        assert r003[0].level == "error"
-
-
-# ---------------------------------------------------------------------------
-# R004 — prob_hi[i] must be > prob_lo[i]
-# ---------------------------------------------------------------------------
-
-
-class TestR004:
-    def test_valid_bounds_ok(self) -> None:
-        msgs = validate(_defaults(**{
-            "remora.prob_lo": [0.0, 0.0, -150.0],
-            "remora.prob_hi": [41000.0, 80000.0, 0.0],
-        }))
-        assert all(m.rule_id != "R004" for m in msgs)
-
-    def test_equal_bounds_errors(self) -> None:
-        msgs = validate(_defaults(**{
-            "remora.prob_lo": [0.0, 0.0, 0.0],
-            "remora.prob_hi": [0.0, 0.0, 0.0],
-        }))
-        r004 = [m for m in msgs if m.rule_id == "R004"]
-        assert len(r004) == 3  # one per dimension
-        assert all(m.level == "error" for m in r004)
-
-    def test_inverted_single_axis_errors(self) -> None:
-        msgs = validate(_defaults(**{
+        r002 = validate_indexed(params)["R002"]
+        assert [m.parameter_keys[1] for m in r002] == [
+            "remora.bc.xlo.type",
+            "remora.bc.zlo.type",
+            "remora.bc.zhi.type",
+        ]
+
+    @pytest.mark.extended
+    def test_r004_inverted_single_axis_names_axis(
+        self, validate_indexed: ValidateIndexed
+    ) -> None:
+        r004 = validate_indexed(_defaults(**{
             "remora.prob_lo": [0.0, 0.0, 0.0],
             "remora.prob_hi": [100.0, 100.0, -50.0],
-        }))
-        r004 = [m for m in msgs if m.rule_id == "R004"]
+        }))["R004"]
         assert len(r004) == 1
         assert "z" in r004[0].message
 
+    def test_r004_reports_every_axis_in_order(self, validate_indexed: ValidateIndexed) -> None:
+        r004 = validate_indexed(_defaults(**{
+            "remora.prob_lo": [0.0, 0.0, 0.0],
+            "remora.prob_hi": [0.0, 0.0, 0.0],
+        }))["R004"]
+        assert [m.message for m in r004] == [
+            f"prob_hi[{axis}]=0.0 must be greater than prob_lo[{axis}]=0.0."
+            for axis in ("x", "y", "z")
+        ]
+
+    def test_r004_flags_nan_bounds(self, validate_indexed: ValidateIndexed) -> None:
+        r004 = validate_indexed(_defaults(**{
+            "remora.prob_lo": [0.0, 0.0, 0.0],
+            "remora.prob_hi": [float("nan"), 1.0, 1.0],
+        }))["R004"]
+        assert len(r004) == 1
+        assert "prob_hi[x]" in r004[0].message
 
-# ---------------------------------------------------------------------------
-# R005 — Coriolis sub-params when use_coriolis=false
-# ---------------------------------------------------------------------------
-
-
-class TestR005:
-    def test_coriolis_enabled_no_info(self) -> None:
-        msgs = validate(_defaults(**{"remora.use_coriolis": True}))
-        assert all(m.rule_id != "R005" for m in msgs)
-
-    def test_coriolis_disabled_with_sub_params_info(self) -> None:
-        params = _defaults(**{"remora.use_coriolis": False})
-        # Defaults include coriolis sub-params from schema
-        msgs = validate(params)
-        r005 = [m for m in msgs if m.rule_id == "R005"]
-        assert len(r005) == 1
-        assert r005[0].level == "info"
-
-
-# ---------------------------------------------------------------------------
-# R006 — max_grid_size >= blocking_factor
-# ---------------------------------------------------------------------------
-
-
-class TestR006:
-    def test_grid_ge_blocking_ok(self) -> None:
-        msgs = validate(_defaults(**{
-            "amr.max_grid_size": 2048,
-            "amr.blocking_factor": 1,
-        }))
-        assert all(m.rule_id != "R006" for m in msgs)
-
-    def test_grid_lt_blocking_warns(self) -> None:
-        msgs = validate(_defaults(**{
-            "amr.max_grid_size": 4,
-            "amr.blocking_factor": 16,
-        }))
-        r006 = [m for m in msgs if m.rule_id == "R006"]
-        assert len(r006) == 1
-        assert r006[0].level == "warning"
-
-
-# ---------------------------------------------------------------------------
-# R007 — CFL condition estimate
-# ---------------------------------------------------------------------------
-
-
-class TestR007:
-    def test_no_warning_when_cfl_ok(self) -> None:
-        # dx_min = 150/16 = 9.375m, dt = 1s → CFL = 1 * 2 / 9.375 = 0.21 < 1
-        params = _defaults(**{
-            "remora.fixed_dt": 1.0,
-            "remora.prob_lo": [0.0, 0.0, -150.0],
-            "remora.prob_hi": [41000.0, 80000.0, 0.0],
-            "remora.n_cell": [41, 80, 16],
-        })
-        msgs = validate(params)
-        assert all(m.rule_id != "R007" for m in msgs)
-
-    def test_warning_when_cfl_violated(self) -> None:
-        # dx = 41000/41 = 1000m, dt = 1000s → CFL = 1000 * 2 / 1000 = 2.0 > 1
-        params = _defaults(**{
-            "remora.fixed_dt": 1000.0,
-            "remora.prob_lo": [0.0, 0.0, -150.0],
-            "remora.prob_hi": [41000.0, 80000.0, 0.0],
-            "remora.n_cell": [41, 80, 16],
-        })
-        msgs = validate(params)
-        r007 = [m for m in msgs if m.rule_id == "R007"]
-        assert len(r007) == 1
-        assert r007[0].level == "warning"
-
-    def test_skipped_when_dt_missing(self) -> None:
-        params = _defaults()
-        params.pop("remora.fixed_dt", None)
-        msgs = validate(params)
-        assert all(m.rule_id != "R007" for m in msgs)
-
-
-# ---------------------------------------------------------------------------
-# R008 — num_procs should evenly divide the domain
-# ---------------------------------------------------------------------------
-
-
-class TestR008:
-    def test_no_warning_when_evenly_divisible(self) -> None:
-        # 41 * 80 * 16 cells, max_grid_size=2048
-        # With 1 proc, always fine
-        params = _defaults(**{"remora.n_cell": [80, 80, 16]})
-        msgs = validate(params, num_procs=4)
-        assert all(m.rule_id != "R008" for m in msgs)
-
-    def test_warning_when_not_divisible(self) -> None:
-        # n_cell = [7, 7, 7], num_procs = 4 → total cells 343 not divisible by 4
-        params = _defaults(**{"remora.n_cell": [7, 7, 7]})
-        msgs = validate(params, num_procs=4)
-        r008 = [m for m in msgs if m.rule_id == "R008"]
-        assert len(r008) == 1
-        assert r008[0].level == "warning"
-
-    def test_skipped_when_num_procs_1(self) -> None:
-        params = _defaults(**{"remora.n_cell": [7, 7, 7]})
-        msgs = validate(params, num_procs=1)
-        assert all(m.rule_id != "R008" for m in msgs)
-
-
-# ---------------------------------------------------------------------------
-# R009 — n_cell should be divisible by blocking_factor
-# ---------------------------------------------------------------------------
-
-
-class TestR009:
-    def test_no_warning_when_divisible(self) -> None:
-        params = _defaults(**{
-            "remora.n_cell": [80, 80, 16],
-            "amr.blocking_factor": 8,
-        })
-        msgs = validate(params)
-        assert all(m.rule_id != "R009" for m in msgs)
-
-    def test_warning_when_not_divisible(self) -> None:
-        params = _defaults(**{
+    def test_r009_names_offending_value(self, validate_indexed: ValidateIndexed) -> None:
+        r009 = validate_indexed(_defaults(**{
             "remora.n_cell": [41, 80, 16],
             "amr.blocking_factor": 8,
-        })
-        msgs = validate(params)
-        r009 = [m for m in msgs if m.rule_id == "R009"]
-        assert len(r009) == 1
-        assert r009[0].level == "warning"
+        }))["R009"]
         assert "41" in r009[0].message
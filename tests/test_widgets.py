@@ -2,101 +2,172 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+from math import isclose
+
 import pytest
 
 from remora_gui.core.parameter_schema import REMORAParameter
-from remora_gui.ui.widgets.collapsible_group import CollapsibleGroupBox
-from remora_gui.ui.widgets.enum_combo import EnumComboBox
-from remora_gui.ui.widgets.file_picker import FilePickerWidget
-from remora_gui.ui.widgets.parameter_widget import ParameterWidget, ScientificSpinBox
-from remora_gui.ui.widgets.vector3_widget import Vector3Widget
+
+pytest.importorskip("pytestqt")
+
+# One worker owns the QApplication and the module-scoped widgets.
+pytestmark = [pytest.mark.gui, pytest.mark.xdist_group("gui")]
+
+
+@pytest.fixture(scope="module")
+def widgets_mod(qapp):
+    """Import the Qt widget package on first use, not at collection time."""
+    from remora_gui.ui import widgets
+
+    return widgets
+
+
+def _close(got, expected, tol=1e-6):
+    """Float-tolerant equality for scalars and flat lists (cheaper than pytest.approx)."""
+    if isinstance(expected, list):
+        return len(got) == len(expected) and all(
+            _close(g, e, tol) for g, e in zip(got, expected, strict=True)
+        )
+    if isinstance(expected, bool):
+        return got is expected
+    if isinstance(expected, float):
+        return isclose(got, expected, rel_tol=tol, abs_tol=1e-12)
+    return got == expected
+
+
+@contextlib.contextmanager
+def _spy(signal):
+    """Record emissions of *signal* synchronously, without an event loop."""
+    hits = []
+
+    def slot(*args):
+        hits.append(args)
+
+    signal.connect(slot)
+    try:
+        yield hits
+    finally:
+        signal.disconnect(slot)
+
+
+# ---- Shared widget fixtures ----
+# Widget construction (style and font resolution) dominates these tests, so
+# one instance per module is reused; tests set the state they check or reset
+# it afterwards.
+
+
+@pytest.fixture(scope="module")
+def vec3_float(widgets_mod):
+    w = widgets_mod.Vector3Widget(float_mode=True)
+    yield w
+    w.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def vec3_int(widgets_mod):
+    w = widgets_mod.Vector3Widget(float_mode=False)
+    yield w
+    w.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def enum_combo(widgets_mod):
+    w = widgets_mod.EnumComboBox(["alpha", "beta", "gamma"])
+    yield w
+    w.deleteLater()
+
 
 # ---- Vector3Widget ----
 
 
 class TestVector3WidgetFloat:
-    def test_default_value(self, qtbot):
-        w = Vector3Widget(float_mode=True)
-        qtbot.addWidget(w)
+    @pytest.fixture(autouse=True)
+    def _reset(self, vec3_float):
+        yield
+        vec3_float.set_value([0.0, 0.0, 0.0])
+
+    def test_default_value(self, qtbot_lite, widgets_mod):
+        # A fresh widget: the shared one has been through _reset.
+        w = widgets_mod.Vector3Widget(float_mode=True)
+        qtbot_lite.addWidget(w)
         assert w.value() == [0.0, 0.0, 0.0]
 
-    def test_set_and_get(self, qtbot):
-        w = Vector3Widget(float_mode=True)
-        qtbot.addWidget(w)
-        w.set_value([1.5, -2.3, 100.0])
-        assert w.value() == pytest.approx([1.5, -2.3, 100.0])
+    def test_set_and_get(self, vec3_float):
+        vec3_float.set_value([1.5, -2.3, 100.0])
+        assert _close(vec3_float.value(), [1.5, -2.3, 100.0]), vec3_float.value()
 
-    def test_signal_fires(self, qtbot):
-        w = Vector3Widget(float_mode=True)
-        qtbot.addWidget(w)
-        with qtbot.waitSignal(w.value_changed):
-            w.set_value([1.0, 2.0, 3.0])
+    def test_signal_fires(self, vec3_float):
+        with _spy(vec3_float.value_changed) as hits:
+            vec3_float.set_value([1.0, 2.0, 3.0])
+        assert hits == [([1.0, 2.0, 3.0],)]
 
 
 class TestVector3WidgetInt:
-    def test_default_value(self, qtbot):
-        w = Vector3Widget(float_mode=False)
-        qtbot.addWidget(w)
+    @pytest.fixture(autouse=True)
+    def _reset(self, vec3_int):
+        yield
+        vec3_int.set_value([0, 0, 0])
+
+    def test_default_value(self, qtbot_lite, widgets_mod):
+        w = widgets_mod.Vector3Widget(float_mode=False)
+        qtbot_lite.addWidget(w)
         assert w.value() == [0, 0, 0]
 
-    def test_set_and_get(self, qtbot):
-        w = Vector3Widget(float_mode=False)
-        qtbot.addWidget(w)
-        w.set_value([10, 20, 30])
-        assert w.value() == [10, 20, 30]
+    def test_set_and_get(self, vec3_int):
+        vec3_int.set_value([10, 20, 30])
+        assert vec3_int.value() == [10, 20, 30]
 
 
 # ---- EnumComboBox ----
 
 
 class TestEnumComboBox:
-    def test_options_populated(self, qtbot):
-        w = EnumComboBox(["alpha", "beta", "gamma"])
-        qtbot.addWidget(w)
-        assert w.count() == 3
+    def test_options_populated(self, enum_combo):
+        assert enum_combo.count() == 3
 
-    def test_set_and_get(self, qtbot):
-        w = EnumComboBox(["alpha", "beta", "gamma"])
-        qtbot.addWidget(w)
-        w.set_value("beta")
-        assert w.value() == "beta"
+    def test_set_and_get(self, enum_combo):
+        enum_combo.set_value("beta")
+        assert enum_combo.value() == "beta"
 
-    def test_signal_fires(self, qtbot):
-        w = EnumComboBox(["alpha", "beta"])
-        qtbot.addWidget(w)
-        with qtbot.waitSignal(w.enum_value_changed):
-            w.set_value("beta")
+    def test_signal_fires(self, enum_combo):
+        enum_combo.set_value("alpha")
+        with _spy(enum_combo.enum_value_changed) as hits:
+            enum_combo.set_value("beta")
+        assert hits == [("beta",)]
 
 
 # ---- FilePickerWidget ----
 
 
 class TestFilePickerWidget:
-    def test_set_and_get(self, qtbot):
-        w = FilePickerWidget()
-        qtbot.addWidget(w)
+    def test_set_and_get(self, qtbot_lite, widgets_mod):
+        w = widgets_mod.FilePickerWidget()
+        qtbot_lite.addWidget(w)
         w.set_value("/tmp/test.txt")
         assert w.value() == "/tmp/test.txt"
 
-    def test_signal_fires(self, qtbot):
-        w = FilePickerWidget()
+    def test_signal_fires(self, qtbot, widgets_mod):
+        w = widgets_mod.FilePickerWidget()
         qtbot.addWidget(w)
-        with qtbot.waitSignal(w.value_changed):
+        with _spy(w.value_changed) as hits:
             w.set_value("/tmp/foo")
+        assert hits == [("/tmp/foo",)]
 
 
 # ---- CollapsibleGroupBox ----
 
 
 class TestCollapsibleGroupBox:
-    def test_starts_expanded(self, qtbot):
-        w = CollapsibleGroupBox("Test Group")
-        qtbot.addWidget(w)
+    def test_starts_expanded(self, qtbot_lite, widgets_mod):
+        w = widgets_mod.CollapsibleGroupBox("Test Group")
+        qtbot_lite.addWidget(w)
         assert w.isChecked()
 
-    def test_collapse_hides_content(self, qtbot):
-        w = CollapsibleGroupBox("Test Group")
-        qtbot.addWidget(w)
+    def test_collapse_hides_content(self, qtbot_lite, widgets_mod):
+        w = widgets_mod.CollapsibleGroupBox("Test Group")
+        qtbot_lite.addWidget(w)
         w.setChecked(False)
         assert not w.isChecked()
 
@@ -105,115 +176,101 @@ class TestCollapsibleGroupBox:
 
 
 class TestScientificSpinBox:
-    def test_large_value_scientific(self, qtbot):
-        box = ScientificSpinBox()
-        qtbot.addWidget(box)
+    def test_large_value_scientific(self, qtbot_lite, widgets_mod):
+        box = widgets_mod.ScientificSpinBox()
+        qtbot_lite.addWidget(box)
         box.setRange(-1e15, 1e15)
         box.setDecimals(8)
         text = box.textFromValue(1.7e-4)
         assert "e" in text or "E" in text
 
-    def test_normal_value_not_scientific(self, qtbot):
-        box = ScientificSpinBox()
-        qtbot.addWidget(box)
+    def test_normal_value_not_scientific(self, qtbot_lite, widgets_mod):
+        box = widgets_mod.ScientificSpinBox()
+        qtbot_lite.addWidget(box)
         box.setDecimals(2)
         text = box.textFromValue(42.0)
         assert "e" not in text.lower()
 
-    def test_value_from_text_scientific(self, qtbot):
-        box = ScientificSpinBox()
-        qtbot.addWidget(box)
-        assert box.valueFromText("1.7e-4") == pytest.approx(1.7e-4)
+    def test_value_from_text_scientific(self, qtbot_lite, widgets_mod):
+        box = widgets_mod.ScientificSpinBox()
+        qtbot_lite.addWidget(box)
+        assert _close(box.valueFromText("1.7e-4"), 1.7e-4)
 
 
 # ---- ParameterWidget ----
 
 
+_BASE_PARAM = REMORAParameter(
+    key="remora.test",
+    label="Test",
+    description="A test parameter",
+    group="domain",
+    dtype="int",
+    default=None,
+)
+
+
 def _make_param(**overrides) -> REMORAParameter:
     """Helper to build a REMORAParameter with sensible defaults."""
-    defaults = {
-        "key": "remora.test",
-        "label": "Test",
-        "description": "A test parameter",
-        "group": "domain",
-        "dtype": "int",
-        "default": None,
+    return dataclasses.replace(_BASE_PARAM, **overrides)
+
+
+# One widget per dtype, built from these parameter overrides.
+_PARAM_WIDGET_SPECS: dict[str, dict] = {
+    "int": {"default": 10},
+    "float": {"default": 3.14},
+    "bool": {"default": True},
+    "string": {"default": "hello"},
+    "enum": {"default": "beta", "enum_options": ["alpha", "beta", "gamma"]},
+    "int_vec3": {"default": [10, 20, 30]},
+    "float_vec3": {"default": [1.0, 2.0, 3.0]},
+    "string_list": {"default": ["salt", "temp"]},
+}
+
+
+@pytest.fixture(scope="module")
+def param_widgets(widgets_mod):
+    widgets = {
+        dtype: widgets_mod.ParameterWidget(_make_param(dtype=dtype, **spec))
+        for dtype, spec in _PARAM_WIDGET_SPECS.items()
     }
-    defaults.update(overrides)
-    return REMORAParameter(**defaults)
-
-
-class TestParameterWidgetInt:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="int", default=10)
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == 10
-
-    def test_signal_fires(self, qtbot):
-        p = _make_param(dtype="int", default=0)
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        with qtbot.waitSignal(w.value_changed):
+    yield widgets
+    for w in widgets.values():
+        w.deleteLater()
+
+
+# (dtype, value, expected) — expected is compared with _close().
+_PARAM_WIDGET_CASES = [
+    ("int", 10, 10),
+    ("float", 3.14, 3.14),
+    ("bool", True, True),
+    ("bool", False, False),
+    ("string", "hello", "hello"),
+    ("enum", "beta", "beta"),
+    ("int_vec3", [10, 20, 30], [10, 20, 30]),
+    ("float_vec3", [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]),
+    ("string_list", ["salt", "temp"], ["salt", "temp"]),
+]
+
+
+class TestParameterWidget:
+    @pytest.mark.parametrize(("dtype", "value", "expected"), _PARAM_WIDGET_CASES)
+    def test_initial_value_from_default(self, qtbot_lite, widgets_mod, dtype, value, expected):
+        spec = {**_PARAM_WIDGET_SPECS[dtype], "default": value}
+        w = widgets_mod.ParameterWidget(_make_param(dtype=dtype, **spec))
+        qtbot_lite.addWidget(w)
+        assert _close(w.value(), expected), w.value()
+
+    @pytest.mark.parametrize(("dtype", "value", "expected"), _PARAM_WIDGET_CASES)
+    def test_set_and_get(self, param_widgets, dtype, value, expected):
+        w = param_widgets[dtype]
+        w.set_value(value)
+        assert _close(w.value(), expected), w.value()
+
+    def test_signal_fires(self, param_widgets):
+        w = param_widgets["int"]
+        w.set_value(0)
+        with _spy(w.value_changed) as hits:
             # Directly manipulate the spin box (not set_value which blocks signals).
             w._input.setValue(42)
-
-
-class TestParameterWidgetFloat:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="float", default=3.14)
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == pytest.approx(3.14)
-
-
-class TestParameterWidgetBool:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="bool", default=True)
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() is True
-
-    def test_set_false(self, qtbot):
-        p = _make_param(dtype="bool", default=False)
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() is False
-
-
-class TestParameterWidgetString:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="string", default="hello")
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == "hello"
-
-
-class TestParameterWidgetEnum:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="enum", default="beta", enum_options=["alpha", "beta", "gamma"])
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == "beta"
-
-
-class TestParameterWidgetVec3:
-    def test_int_vec3(self, qtbot):
-        p = _make_param(dtype="int_vec3", default=[10, 20, 30])
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == [10, 20, 30]
-
-    def test_float_vec3(self, qtbot):
-        p = _make_param(dtype="float_vec3", default=[1.0, 2.0, 3.0])
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == pytest.approx([1.0, 2.0, 3.0])
-
-
-class TestParameterWidgetStringList:
-    def test_set_and_get(self, qtbot):
-        p = _make_param(dtype="string_list", default=["salt", "temp"])
-        w = ParameterWidget(p)
-        qtbot.addWidget(w)
-        assert w.value() == ["salt", "temp"]
+        assert hits == [("remora.test", 42)]
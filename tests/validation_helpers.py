@@ -0,0 +1,29 @@
+"""Shared helpers for the core/validator.py tests."""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+from remora_gui.core.validator import ValidationMessage
+
+
+class MessagesByRule(defaultdict[str, list[ValidationMessage]]):
+    """Validation messages bucketed by ``rule_id`` in a single pass.
+
+    Missing rule ids read as an empty list.
+    """
+
+    def __init__(self, messages: Iterable[ValidationMessage]) -> None:
+        super().__init__(list)
+        for m in messages:
+            self[m.rule_id].append(m)
+
+    @property
+    def rule_ids(self) -> set[str]:
+        """Ids of the rules that produced at least one message."""
+        return {rule_id for rule_id, msgs in self.items() if msgs}
+
+    def counts(self) -> Counter[str]:
+        """Number of messages per rule id."""
+        return Counter({rule_id: len(msgs) for rule_id, msgs in self.items() if msgs})